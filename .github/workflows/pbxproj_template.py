@@ -0,0 +1,375 @@
+"""Shared payloads and helpers for the ARIA iOS project generator scripts."""
+import hashlib
+from pathlib import Path
+
+ASSETS_BYTES = b'{"images":[{"idiom":"universal","platform":"ios","size":"1024x1024"}],"info":{"author":"xcode","version":1}}'
+
+# Info.plist and build settings for the UIKit app delegate variant
+APPDELEGATE_PLIST_BYTES = b'''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>CFBundleDevelopmentRegion</key>
+    <string>en</string>
+    <key>CFBundleExecutable</key>
+    <string>ARIA</string>
+    <key>CFBundleIdentifier</key>
+    <string>com.officialzpb.aria</string>
+    <key>CFBundleInfoDictionaryVersion</key>
+    <string>6.0</string>
+    <key>CFBundleName</key>
+    <string>ARIA</string>
+    <key>CFBundlePackageType</key>
+    <string>APPL</string>
+    <key>CFBundleShortVersionString</key>
+    <string>1.0</string>
+    <key>CFBundleVersion</key>
+    <string>1</string>
+    <key>LSRequiresIPhoneOS</key>
+    <true/>
+    <key>UIApplicationSceneManifest</key>
+    <dict>
+        <key>UIApplicationSupportsMultipleScenes</key>
+        <true/>
+    </dict>
+    <key>UIApplicationSupportsIndirectInputEvents</key>
+    <true/>
+    <key>UILaunchScreen</key>
+    <dict/>
+    <key>UISupportedInterfaceOrientations</key>
+    <array>
+        <string>UIInterfaceOrientationPortrait</string>
+    </array>
+</dict>
+</plist>'''
+
+APPDELEGATE_BUILD_SETTINGS = {
+    'debug_project': '''\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;
+\t\t\t\tCLANG_ENABLE_MODULES = YES;
+\t\t\t\tDEBUG_INFORMATION_FORMAT = dwarf;
+\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = 16.0;
+\t\t\t\tSDKROOT = iphoneos;
+\t\t\t\tSWIFT_OPTIMIZATION_LEVEL = "-Onone";
+''',
+    'release_project': '''\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;
+\t\t\t\tCLANG_ENABLE_MODULES = YES;
+\t\t\t\tDEBUG_INFORMATION_FORMAT = "dwarf-with-dsym";
+\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = 16.0;
+\t\t\t\tSDKROOT = iphoneos;
+\t\t\t\tSWIFT_COMPILATION_MODE = wholemodule;
+\t\t\t\tVALIDATE_PRODUCT = YES;
+''',
+    'target': '''\t\t\t\tASSETCATALOG_COMPILER_APPICON_NAME = AppIcon;
+\t\t\t\tCODE_SIGN_STYLE = Automatic;
+\t\t\t\tGENERATE_INFOPLIST_FILE = YES;
+\t\t\t\tINFOPLIST_FILE = ARIA/Info.plist;
+\t\t\t\tLD_RUNPATH_SEARCH_PATHS = ("$(inherited)", "@executable_path/Frameworks");
+\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = com.officialzpb.aria;
+\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME)";
+\t\t\t\tSWIFT_VERSION = 5.0;
+''',
+}
+
+# Info.plist and build settings for the SwiftUI @main variant
+APPMAIN_PLIST_BYTES = b'''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>CFBundleDevelopmentRegion</key>
+    <string>en</string>
+    <key>CFBundleExecutable</key>
+    <string>ARIA</string>
+    <key>CFBundleIdentifier</key>
+    <string>com.officialzpb.aria</string>
+    <key>CFBundleInfoDictionaryVersion</key>
+    <string>6.0</string>
+    <key>CFBundleName</key>
+    <string>ARIA</string>
+    <key>CFBundlePackageType</key>
+    <string>APPL</string>
+    <key>CFBundleShortVersionString</key>
+    <string>1.0.0</string>
+    <key>CFBundleVersion</key>
+    <string>1</string>
+    <key>LSRequiresIPhoneOS</key>
+    <true/>
+    <key>UIApplicationSceneManifest</key>
+    <dict>
+        <key>UIApplicationSupportsMultipleScenes</key>
+        <true/>
+    </dict>
+    <key>UIApplicationSupportsIndirectInputEvents</key>
+    <true/>
+    <key>UILaunchScreen</key>
+    <dict/>
+    <key>UISupportedInterfaceOrientations</key>
+    <array>
+        <string>UIInterfaceOrientationPortrait</string>
+    </array>
+    <key>NSMicrophoneUsageDescription</key>
+    <string>ARIA needs microphone access for voice commands</string>
+    <key>NSSpeechRecognitionUsageDescription</key>
+    <string>ARIA needs speech recognition to process your voice</string>
+</dict>
+</plist>'''
+
+APPMAIN_BUILD_SETTINGS = {
+    'debug_project': '''\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;
+\t\t\t\tCLANG_ENABLE_MODULES = YES;
+\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;
+\t\t\t\tDEBUG_INFORMATION_FORMAT = dwarf;
+\t\t\t\tENABLE_TESTABILITY = YES;
+\t\t\t\tGCC_OPTIMIZATION_LEVEL = 0;
+\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = 16.0;
+\t\t\t\tONLY_ACTIVE_ARCH = YES;
+\t\t\t\tSDKROOT = iphoneos;
+\t\t\t\tSWIFT_OPTIMIZATION_LEVEL = "-Onone";
+''',
+    'release_project': '''\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;
+\t\t\t\tCLANG_ENABLE_MODULES = YES;
+\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;
+\t\t\t\tDEBUG_INFORMATION_FORMAT = "dwarf-with-dsym";
+\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = 16.0;
+\t\t\t\tSDKROOT = iphoneos;
+\t\t\t\tSWIFT_COMPILATION_MODE = wholemodule;
+\t\t\t\tVALIDATE_PRODUCT = YES;
+''',
+    'target': '''\t\t\t\tASSETCATALOG_COMPILER_APPICON_NAME = AppIcon;
+\t\t\t\tCODE_SIGN_STYLE = Automatic;
+\t\t\t\tCURRENT_PROJECT_VERSION = 1;
+\t\t\t\tGENERATE_INFOPLIST_FILE = YES;
+\t\t\t\tINFOPLIST_FILE = ARIA/Info.plist;
+\t\t\t\tINFOPLIST_KEY_NSMicrophoneUsageDescription = "ARIA needs microphone access";
+\t\t\t\tINFOPLIST_KEY_NSSpeechRecognitionUsageDescription = "ARIA needs speech recognition";
+\t\t\t\tINFOPLIST_KEY_UILaunchScreen_Generation = YES;
+\t\t\t\tLD_RUNPATH_SEARCH_PATHS = ("$(inherited)", "@executable_path/Frameworks");
+\t\t\t\tMARKETING_VERSION = 1.0;
+\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = com.officialzpb.aria;
+\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME)";
+\t\t\t\tSWIFT_VERSION = 5.0;
+\t\t\t\tTARGETED_DEVICE_FAMILY = "1,2";
+''',
+}
+
+
+def gen_uuid(key):
+    # Derived from the object's slot name so re-runs emit identical IDs
+    return hashlib.blake2b(key.encode(), digest_size=12, person=b'ARIA-pbx').hexdigest().upper()
+
+
+def write_if_changed(path, data):
+    # Leave the file (and its mtime) alone if the content is unchanged
+    path = Path(path)
+    try:
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
+
+def render_pbxproj(swift_files, build_settings):
+    names = (
+        'root', 'main_group', 'products_group', 'aria_group', 'app_ref',
+        'assets_ref', 'plist_ref', 'target', 'sources_phase', 'resources_phase',
+        'frameworks_phase', 'project_config', 'target_config', 'debug_proj',
+        'release_proj', 'debug_target', 'release_target', 'assets_build'
+    )
+    uuids = {name: gen_uuid(name) for name in names}
+    (root, main_group, products_group, aria_group, app_ref,
+     assets_ref, plist_ref, target, sources_phase, resources_phase,
+     frameworks_phase, project_config, target_config, debug_proj,
+     release_proj, debug_target, release_target, assets_build) = (uuids[name] for name in names)
+    debug_project_settings = build_settings['debug_project']
+    release_project_settings = build_settings['release_project']
+    target_settings = build_settings['target']
+
+    # Build file references
+    file_refs = []
+    build_files = []
+    children = []
+    sources = []
+
+    for fname in swift_files:
+        fref = gen_uuid(fname)
+        bref = gen_uuid(fname + ':build')
+        file_refs.append(f'\t\t{fref} /* {fname} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = {fname}; sourceTree = "<group>"; }};\n')
+        build_files.append(f'\t\t{bref} /* {fname} in Sources */ = {{isa = PBXBuildFile; fileRef = {fref} /* {fname} */; }};\n')
+        children.append(f'\t\t\t\t{fref} /* {fname} */,\n')
+        sources.append(f'\t\t\t\t{bref} /* {fname} in Sources */,\n')
+
+    # Create project.pbxproj
+    parts = []
+    parts.append('''// !$*UTF8*$!
+{
+\tarchiveVersion = 1;
+\tclasses = {};
+\tobjectVersion = 56;
+\tobjects = {
+
+''')
+    parts.append('''/* Begin PBXBuildFile section */
+''')
+    parts += build_files
+    parts.append(f'''\t\t{assets_build} /* Assets.xcassets in Resources */ = {{isa = PBXBuildFile; fileRef = {assets_ref} /* Assets.xcassets */; }};
+/* End PBXBuildFile section */
+
+''')
+    parts.append(f'''/* Begin PBXFileReference section */
+\t\t{app_ref} /* ARIA.app */ = {{isa = PBXFileReference; explicitFileType = wrapper.application; includeInIndex = 0; path = ARIA.app; sourceTree = BUILT_PRODUCTS_DIR; }};
+''')
+    parts += file_refs
+    parts.append(f'''\t\t{assets_ref} /* Assets.xcassets */ = {{isa = PBXFileReference; lastKnownFileType = folder.assetcatalog; path = Assets.xcassets; sourceTree = "<group>"; }};
+\t\t{plist_ref} /* Info.plist */ = {{isa = PBXFileReference; lastKnownFileType = text.plist.xml; path = Info.plist; sourceTree = "<group>"; }};
+/* End PBXFileReference section */
+
+''')
+    parts.append(f'''/* Begin PBXFrameworksBuildPhase section */
+\t\t{frameworks_phase} /* Frameworks */ = {{
+\t\t\tisa = PBXFrameworksBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = ();
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXFrameworksBuildPhase section */
+
+''')
+    parts.append(f'''/* Begin PBXGroup section */
+\t\t{main_group} = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t{aria_group} /* ARIA */,
+\t\t\t\t{products_group} /* Products */,
+\t\t\t);
+\t\t\tsourceTree = "<group>";
+\t\t}};
+\t\t{products_group} /* Products */ = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t{app_ref} /* ARIA.app */,
+\t\t\t);
+\t\t\tname = Products;
+\t\t\tsourceTree = "<group>";
+\t\t}};
+\t\t{aria_group} /* ARIA */ = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+''')
+    parts += children
+    parts.append(f'''\t\t\t\t{assets_ref} /* Assets.xcassets */,
+\t\t\t\t{plist_ref} /* Info.plist */,
+\t\t\t);
+\t\t\tpath = ARIA;
+\t\t\tsourceTree = "<group>";
+\t\t}};
+/* End PBXGroup section */
+
+''')
+    parts.append(f'''/* Begin PBXNativeTarget section */
+\t\t{target} /* ARIA */ = {{
+\t\t\tisa = PBXNativeTarget;
+\t\t\tbuildConfigurationList = {target_config} /* Build configuration list for PBXNativeTarget "ARIA" */;
+\t\t\tbuildPhases = (
+\t\t\t\t{sources_phase} /* Sources */,
+\t\t\t\t{frameworks_phase} /* Frameworks */,
+\t\t\t\t{resources_phase} /* Resources */,
+\t\t\t);
+\t\t\tbuildRules = ();
+\t\t\tdependencies = ();
+\t\t\tname = ARIA;
+\t\t\tproductName = ARIA;
+\t\t\tproductReference = {app_ref} /* ARIA.app */;
+\t\t\tproductType = "com.apple.product-type.application";
+\t\t}};
+/* End PBXNativeTarget section */
+
+''')
+    parts.append(f'''/* Begin PBXProject section */
+\t\t{root} /* Project object */ = {{
+\t\t\tisa = PBXProject;
+\t\t\tbuildConfigurationList = {project_config} /* Build configuration list for PBXProject "ARIA" */;
+\t\t\tcompatibilityVersion = "Xcode 14.0";
+\t\t\tdevelopmentRegion = en;
+\t\t\thasScannedForEncodings = 0;
+\t\t\tknownRegions = (en, Base);
+\t\t\tmainGroup = {main_group};
+\t\t\tproductRefGroup = {products_group} /* Products */;
+\t\t\tprojectDirPath = "";
+\t\t\tprojectRoot = "";
+\t\t\ttargets = ({target} /* ARIA */);
+\t\t}};
+/* End PBXProject section */
+
+''')
+    parts.append(f'''/* Begin PBXResourcesBuildPhase section */
+\t\t{resources_phase} /* Resources */ = {{
+\t\t\tisa = PBXResourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+\t\t\t\t{assets_build} /* Assets.xcassets in Resources */,
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXResourcesBuildPhase section */
+
+''')
+    parts.append(f'''/* Begin PBXSourcesBuildPhase section */
+\t\t{sources_phase} /* Sources */ = {{
+\t\t\tisa = PBXSourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+''')
+    parts += sources
+    parts.append('''\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t};
+/* End PBXSourcesBuildPhase section */
+
+''')
+    parts.append(f'''/* Begin XCBuildConfiguration section */
+\t\t{debug_proj} /* Debug */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+{debug_project_settings}\t\t\t}};
+\t\t\tname = Debug;
+\t\t}};
+\t\t{release_proj} /* Release */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+{release_project_settings}\t\t\t}};
+\t\t\tname = Release;
+\t\t}};
+\t\t{debug_target} /* Debug */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+{target_settings}\t\t\t}};
+\t\t\tname = Debug;
+\t\t}};
+\t\t{release_target} /* Release */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+{target_settings}\t\t\t}};
+\t\t\tname = Release;
+\t\t}};
+/* End XCBuildConfiguration section */
+
+''')
+    parts.append(f'''/* Begin XCConfigurationList section */
+\t\t{project_config} /* Build configuration list for PBXProject "ARIA" */ = {{
+\t\t\tisa = XCConfigurationList;
+\t\t\tbuildConfigurations = ({debug_proj} /* Debug */, {release_proj} /* Release */);
+\t\t\tdefaultConfigurationIsVisible = 0;
+\t\t\tdefaultConfigurationName = Release;
+\t\t}};
+\t\t{target_config} /* Build configuration list for PBXNativeTarget "ARIA" */ = {{
+\t\t\tisa = XCConfigurationList;
+\t\t\tbuildConfigurations = ({debug_target} /* Debug */, {release_target} /* Release */);
+\t\t\tdefaultConfigurationIsVisible = 0;
+\t\t\tdefaultConfigurationName = Release;
+\t\t}};
+/* End XCConfigurationList section */
+\t}};
+\trootObject = {root} /* Project object */;
+}}
+''')
+    return ''.join(parts).encode('utf-8')